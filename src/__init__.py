@@ -2,6 +2,23 @@
 
 Provides simple utilities to load CSV data, compute basic statistics, and plot a time series.
 """
-from .analyzer import load_data, compute_stats, plot_series, plot_histogram
+__all__ = [
+    "ColumnHandle",
+    "prepare_column",
+    "load_data",
+    "load_data_iter",
+    "compute_stats",
+    "plot_series",
+    "plot_series_batch",
+    "plot_histogram",
+]
 
-__all__ = ["load_data", "compute_stats", "plot_series", "plot_histogram"]
+
+def __getattr__(name: str):
+    # Import the analyzer (and with it pandas/matplotlib) on first use, so that
+    # `python -m src --help` does not pay for it
+    if name in __all__:
+        from . import analyzer
+
+        return getattr(analyzer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,10 +3,6 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-import pandas as pd
-
-from .analyzer import load_data, compute_stats, plot_series, plot_histogram
-
 
 def main() -> int:
     parser = argparse.ArgumentParser(
@@ -45,12 +41,20 @@ def main() -> int:
         print(f"CSV file not found: {csv_path}")
         return 2
 
+    # Heavy imports (pandas, numpy, matplotlib) are deferred until the arguments are validated
+    from .analyzer import load_data, compute_stats, plot_series, prepare_column
+
     # Load data
     df = load_data(csv_path)
 
-    # Compute and print stats
+    # Compute and print stats. With --hist the column is cleaned once into a handle whose
+    # values and min/max the histogram reuses; otherwise the stats kernel reads it directly.
     try:
-        stats = compute_stats(df, args.column)
+        if args.hist:
+            column = prepare_column(df, args.column)
+            stats = compute_stats(None, column)
+        else:
+            stats = compute_stats(df, args.column)
     except Exception as e:
         print(f"Failed to compute stats for column '{args.column}': {e}")
         return 3
@@ -77,10 +81,12 @@ def main() -> int:
 
     # Plot histogram if requested
     if args.hist:
+        from .analyzer import plot_histogram
+
         try:
             hist_saved = plot_histogram(
-                df,
-                args.column,
+                None,
+                column,
                 bins=int(args.hist_bins),
                 output_path=Path(args.hist_output),
                 show=bool(args.show),
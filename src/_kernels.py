@@ -0,0 +1,180 @@
+"""Numeric kernels used by the analyzer.
+
+When numba is installed the loops below are JIT-compiled with ``cache=True``, so the
+machine code is written next to this module and reused by later processes; otherwise
+the NumPy implementations are used.
+"""
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import get_num_threads, njit, prange
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; fall back to NumPy implementations
+    HAS_NUMBA = False
+
+
+def _welford_minmax_numpy(arr: np.ndarray) -> Tuple[float, float, float, float, int]:
+    n = int(np.count_nonzero(~np.isnan(arr)))
+    if n == 0:
+        return np.nan, np.nan, np.nan, np.nan, 0
+    # Accumulate in float64 even when the input is float32
+    std = np.nanstd(arr, ddof=1, dtype=np.float64) if n > 1 else 0.0
+    return np.nanmean(arr, dtype=np.float64), np.nanmin(arr), np.nanmax(arr), std, n
+
+
+def _lttb_numpy(t: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    n = y.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    # Middle buckets split points 1..n-2 into n_out-2 contiguous ranges [edges[i], edges[i+1])
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+    counts = np.diff(edges)
+    avg_t = np.add.reduceat(t[: n - 1], edges[:-1]) / counts
+    avg_y = np.add.reduceat(y[: n - 1], edges[:-1]) / counts
+    # Third vertex of each triangle: the next bucket's average, or the last point for the final bucket
+    next_t = np.append(avg_t[1:], t[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs(
+            (t[a] - next_t[i]) * (y[lo:hi] - y[a]) - (t[a] - t[lo:hi]) * (next_y[i] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+if HAS_NUMBA:
+    # fastmath without the nnan/ninf flags, so the NaN test below is not optimised away
+    @njit(cache=True, fastmath={"nsz", "arcp", "contract", "afn", "reassoc"}, boundscheck=False)
+    def _welford_minmax(arr):
+        # Welford's online mean/variance with running min/max, skipping NaNs: a single pass over memory.
+        # Accumulators are float64 even for float32 input.
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        mn = np.inf
+        mx = -np.inf
+        for i in range(arr.shape[0]):
+            v = arr[i]
+            if np.isnan(v):
+                continue
+            n += 1
+            delta = v - mean
+            mean += delta / n
+            m2 += delta * (v - mean)
+            if v < mn:
+                mn = v
+            if v > mx:
+                mx = v
+        if n == 0:
+            return np.nan, np.nan, np.nan, np.nan, 0
+        std = np.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+        return mean, mn, mx, std, n
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _lttb(t, y, n_out):
+        # Same bucketing as _lttb_numpy, with the bucket averages computed inline
+        n = y.shape[0]
+        if n_out >= n or n_out < 3:
+            return np.arange(n)
+        every = (n - 2) / (n_out - 2)
+        keep = np.empty(n_out, dtype=np.int64)
+        keep[0] = 0
+        keep[n_out - 1] = n - 1
+        a = 0
+        for i in range(n_out - 2):
+            lo = int(i * every) + 1
+            hi = int((i + 1) * every) + 1
+            if i < n_out - 3:
+                nhi = int((i + 2) * every) + 1
+                ct = 0.0
+                cy = 0.0
+                for j in range(hi, nhi):
+                    ct += t[j]
+                    cy += y[j]
+                ct /= nhi - hi
+                cy /= nhi - hi
+            else:
+                ct = t[n - 1]
+                cy = y[n - 1]
+            best = -1.0
+            best_j = lo
+            for j in range(lo, hi):
+                area = abs((t[a] - ct) * (y[j] - y[a]) - (t[a] - t[j]) * (cy - y[a]))
+                if area > best:
+                    best = area
+                    best_j = j
+            a = best_j
+            keep[i + 1] = a
+        return keep
+
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def _histogram_counts(arr, edges, n_chunks):
+        # Each of n_chunks threads fills its own row of counts over a contiguous shard;
+        # rows are summed at the end. NaNs fail the range test and are skipped.
+        n = arr.shape[0]
+        n_bins = edges.shape[0] - 1
+        lo = edges[0]
+        hi = edges[n_bins]
+        step = (n + n_chunks - 1) // n_chunks
+        scale = n_bins / (hi - lo)
+        local = np.zeros((n_chunks, n_bins), dtype=np.int64)
+        for c in prange(n_chunks):
+            for i in range(c * step, min(n, (c + 1) * step)):
+                v = arr[i]
+                if v >= lo and v <= hi:
+                    b = int((v - lo) * scale)
+                    if b >= n_bins:
+                        b = n_bins - 1
+                    # Rounding in the scaled index can be off by one for values on a bin edge;
+                    # correct against the edges as np.histogram does (the last bin is closed)
+                    if v < edges[b]:
+                        b -= 1
+                    elif v >= edges[b + 1] and b != n_bins - 1:
+                        b += 1
+                    local[c, b] += 1
+        return local.sum(axis=0)
+else:
+    _welford_minmax = _welford_minmax_numpy
+    _lttb = _lttb_numpy
+
+
+def _histogram(
+    arr: np.ndarray,
+    n_bins: int,
+    value_range: Optional[Tuple[float, float]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Equal-width histogram of the non-NaN values of arr, binned like np.histogram(arr, bins=n_bins).
+
+    :param value_range: Known (min, max) of the non-NaN values; computed from arr if None.
+    :return: (counts, edges) with len(edges) == n_bins + 1.
+    """
+    if n_bins < 1:
+        raise ValueError("`bins` must be positive, when an integer")
+    if value_range is not None:
+        lo, hi = value_range
+        n = arr.shape[0]
+    else:
+        _, lo, hi, _, n = _welford_minmax(arr)
+    if n == 0 or not (np.isfinite(lo) and np.isfinite(hi)):
+        # Empty, all-NaN or infinite data: let NumPy apply (or reject) its own range rules
+        return np.histogram(arr[~np.isnan(arr)], bins=n_bins)
+    # Build the edges in the data's dtype, exactly as np.histogram does
+    lo, hi = arr.dtype.type(lo), arr.dtype.type(hi)
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    edges = np.linspace(lo, hi, n_bins + 1, dtype=arr.dtype)
+    if HAS_NUMBA:
+        return _histogram_counts(arr, edges, get_num_threads()), edges
+    return np.histogram(arr[~np.isnan(arr)], bins=edges)[0], edges
@@ -2,15 +2,48 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, Union, Tuple
+from typing import Dict, Iterator, Optional, Union, Tuple
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from matplotlib import style as mpl_style
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from ._kernels import _histogram, _lttb, _welford_minmax
+
+try:
+    import bottleneck as bn
+    _HAS_BN = True
+except ImportError:  # bottleneck is optional; fall back to pandas rolling windows
+    _HAS_BN = False
 
 
 Number = Union[int, float, np.number]
 
+# Default number of rows per chunk for streaming CSV reads
+DEFAULT_CHUNKSIZE = 1 << 18
+
+# Files larger than this are memory-mapped by pandas.read_csv instead of read through Python buffers
+MMAP_MIN_BYTES = 64 << 20
+
+# Bytes per block handed to each pyarrow CSV parsing thread
+ARROW_BLOCK_SIZE = 8 << 20
+
+# Text columns with fewer distinct values than this fraction of rows are loaded as categoricals
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# Resolution of saved images
+SAVE_DPI = 80
+
+# Line plots with more points than this are drawn without per-point markers by default
+MARKER_MAX_POINTS = 200
+
+# Reusable off-screen figures keyed by (figsize, style), so batch plotting does not rebuild them
+# per call. The style is part of the key because a figure keeps the rcParams it was created with.
+_FIG_CACHE: dict[tuple[tuple[float, float], Optional[str]], tuple[Figure, Axes]] = {}
+
 
 @dataclass(frozen=True)
 class Stats:
@@ -23,24 +56,161 @@ class Stats:
         return {"mean": self.mean, "min": self.min, "max": self.max, "std": self.std}
 
 
-def load_data(csv_path: Union[str, Path], parse_dates: Optional[Union[str, list[str]]] = None) -> pd.DataFrame:
+@dataclass
+class ColumnHandle:
+    """
+    A column cleaned once (numeric, NaNs dropped) for reuse by compute_stats and plot_histogram.
+    Statistics are cached on the handle the first time they are computed.
     """
-    Load CSV data using pandas.read_csv.
+    arr: np.ndarray
+    name: str = ""
+    stats: Optional[Stats] = None
+
+
+def load_data(
+    csv_path: Union[str, Path],
+    parse_dates: Optional[Union[str, list[str]]] = None,
+    chunksize: Optional[int] = None,
+    downcast: bool = False,
+    categorize: bool = True,
+) -> pd.DataFrame:
+    """
+    Load CSV data using pyarrow.csv.read_csv when available, falling back to pandas.read_csv.
 
     :param csv_path: Path to a CSV file.
     :param parse_dates: Column name or list of columns to parse as dates.
+    :param chunksize: If set, read the file in chunks of this many rows and concatenate them,
+        which bounds the parser's peak memory to a single chunk.
+    :param downcast: If True, store float64 columns as float32 to halve their memory footprint,
+        at the cost of precision (about 7 significant digits). Off by default.
+    :param categorize: If True, convert low-cardinality text columns to the 'category' dtype.
     :return: pandas DataFrame with loaded data.
     """
     csv_path = Path(csv_path)
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
-    df = pd.read_csv(csv_path)
-    if parse_dates is not None:
-        df = df.copy()
-        df[parse_dates] = pd.to_datetime(df[parse_dates])
+    df = None
+    if chunksize is not None:
+        chunks = [
+            _downcast_floats(chunk) if downcast else chunk
+            for chunk in load_data_iter(csv_path, parse_dates=parse_dates, chunksize=chunksize)
+        ]
+        if chunks:
+            df = pd.concat(chunks, ignore_index=True)
+    if df is None:
+        df = _read_csv_arrow(csv_path, parse_dates)
+    if df is None:
+        # low_memory=False infers each column's dtype once instead of per internal chunk
+        df = pd.read_csv(csv_path, engine="c", low_memory=False, memory_map=_use_memory_map(csv_path))
+        if parse_dates is not None:
+            df = df.copy()
+            df[parse_dates] = pd.to_datetime(df[parse_dates])
+    if downcast:
+        df = _downcast_floats(df)
+    if categorize:
+        df = _categorize_strings(df)
     return df
 
 
+def _use_memory_map(csv_path: Path) -> bool:
+    return csv_path.stat().st_size > MMAP_MIN_BYTES
+
+
+def _downcast_floats(df: pd.DataFrame) -> pd.DataFrame:
+    float_cols = df.select_dtypes(include=["float64"]).columns
+    if len(float_cols) == 0:
+        return df
+    return df.astype({c: np.float32 for c in float_cols})
+
+
+def _categorize_strings(df: pd.DataFrame) -> pd.DataFrame:
+    if len(df) == 0:
+        return df
+    text_cols = df.select_dtypes(include=["object", "string"]).columns
+    low_card = [c for c in text_cols if df[c].nunique() / len(df) < CATEGORY_MAX_UNIQUE_RATIO]
+    if not low_card:
+        return df
+    return df.astype({c: "category" for c in low_card})
+
+
+def load_data_iter(
+    csv_path: Union[str, Path],
+    parse_dates: Optional[Union[str, list[str]]] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream CSV data as a sequence of DataFrame chunks using pandas.read_csv(chunksize=...).
+
+    :param csv_path: Path to a CSV file.
+    :param parse_dates: Column name or list of columns to parse as dates.
+    :param chunksize: Number of rows per chunk.
+    :return: iterator over DataFrame chunks; the file is closed once the iterator is exhausted.
+    """
+    csv_path = Path(csv_path)
+    if not csv_path.exists():
+        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+    with pd.read_csv(
+        csv_path, chunksize=chunksize, iterator=True, memory_map=_use_memory_map(csv_path)
+    ) as reader:
+        for chunk in reader:
+            if parse_dates is not None:
+                chunk[parse_dates] = pd.to_datetime(chunk[parse_dates])
+            yield chunk
+
+
+def _read_csv_arrow(csv_path: Path, parse_dates: Optional[Union[str, list[str]]] = None) -> Optional[pd.DataFrame]:
+    """
+    Parse CSV with pyarrow's multithreaded reader; returns None if pyarrow is not installed
+    or cannot handle the file (duplicate header names, a date format it does not know), so
+    the caller can fall back to pandas. Columns in parse_dates are parsed by arrow itself, so
+    no pd.to_datetime post-pass is needed; other date-like columns stay text, as with pandas.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+
+    read_options = pacsv.ReadOptions(block_size=ARROW_BLOCK_SIZE, use_threads=True)
+    parse_options = pacsv.ParseOptions(delimiter=",")
+    try:
+        # Peek at the schema arrow infers from the first block
+        with pacsv.open_csv(str(csv_path), read_options=read_options, parse_options=parse_options) as reader:
+            schema = reader.schema
+    except pa.ArrowInvalid:
+        return None
+    if len(set(schema.names)) != len(schema.names):
+        # pandas renames duplicates ('a', 'a.1'); arrow would keep both as 'a'
+        return None
+
+    date_cols = [] if parse_dates is None else [parse_dates] if isinstance(parse_dates, str) else list(parse_dates)
+    missing = [c for c in date_cols if c not in schema.names]
+    if missing:
+        raise KeyError(f"parse_dates columns not found in CSV: {missing}")
+
+    # Arrow infers dates and times on its own; keep the ones that were not requested as text
+    column_types = {f.name: pa.string() for f in schema if pa.types.is_temporal(f.type) and f.name not in date_cols}
+    column_types.update({c: pa.timestamp("ns") for c in date_cols})
+    # Empty text cells become NaN, as with pandas.read_csv
+    convert_options = pacsv.ConvertOptions(
+        strings_can_be_null=True,
+        timestamp_parsers=[pacsv.ISO8601, "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S"],
+        column_types=column_types,
+    )
+    try:
+        table = pacsv.read_csv(
+            str(csv_path),
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+    except pa.ArrowInvalid:
+        return None
+    return table.to_pandas(self_destruct=True, split_blocks=True, use_threads=True)
+
+
 def _series_from(df: pd.DataFrame, column: Union[str, int, pd.Series]) -> pd.Series:
     if isinstance(column, pd.Series):
         s = column
@@ -48,26 +218,173 @@ def _series_from(df: pd.DataFrame, column: Union[str, int, pd.Series]) -> pd.Ser
         s = df[column]
     else:
         raise TypeError("column must be a Series, column name, or index")
+    # Already-numeric columns (the common case after CSV parsing) need no conversion pass
+    if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+        return s
     # Convert to numeric if possible; coerce errors to NaN and drop them for stats
     s = pd.to_numeric(s, errors="coerce")
     return s
 
 
-def compute_stats(df: pd.DataFrame, column: Union[str, int, pd.Series]) -> Dict[str, float]:
+def _array_from(
+    df: pd.DataFrame,
+    column: Union[str, int, pd.Series],
+    dtype: Optional[np.dtype] = None,
+) -> np.ndarray:
+    # Same resolution as _series_from, but hand back a C-contiguous float buffer (NaN = missing).
+    # With dtype=None float32 columns are kept as float32 (no copy); everything else becomes float64.
+    s = _series_from(df, column)
+    if dtype is None:
+        dtype = np.float32 if s.dtype == np.float32 else np.float64
+    return np.ascontiguousarray(s.to_numpy(dtype=dtype, na_value=np.nan))
+
+
+def prepare_column(df: pd.DataFrame, column: Union[str, int, pd.Series]) -> ColumnHandle:
+    """
+    Convert a column to a contiguous float array without NaNs, for sharing between
+    compute_stats and plot_histogram.
+
+    :param df: DataFrame with data.
+    :param column: Column to prepare (name, index, or Series).
+    :return: ColumnHandle wrapping the cleaned values.
+    """
+    arr = _array_from(df, column)
+    return ColumnHandle(arr=np.ascontiguousarray(arr[~np.isnan(arr)]), name=str(column))
+
+
+def _stats_from_array(arr: np.ndarray) -> Stats:
+    # NaNs are skipped inside the kernel, so no compacted copy of the column is made
+    # Sample standard deviation (unbiased, ddof=1); if only one value, std=0.0
+    mean, min_v, max_v, std, n = _welford_minmax(arr)
+    if n == 0:
+        raise ValueError("No numeric data available to compute statistics")
+    return Stats(mean=float(mean), min=float(min_v), max=float(max_v), std=float(std))
+
+
+def compute_stats(
+    df: Optional[pd.DataFrame],
+    column: Union[str, int, pd.Series, ColumnHandle],
+) -> Dict[str, float]:
     """
     Compute basic statistics: mean, min, max, sample std (ddof=1).
     Non-numeric values are coerced to NaN and ignored.
+    If column is a ColumnHandle, df is not used and the result is cached on the handle.
     :returns: dict with keys mean, min, max, std
     """
-    s = _series_from(df, column).dropna()
-    if s.empty:
-        raise ValueError("No numeric data available to compute statistics")
-    mean = float(np.mean(s))
-    min_v = float(np.min(s))
-    max_v = float(np.max(s))
-    # Sample standard deviation (unbiased, ddof=1); if only one value, std=0.0
-    std = float(np.std(s, ddof=1)) if len(s) > 1 else 0.0
-    return Stats(mean=mean, min=min_v, max=max_v, std=std).to_dict()
+    if isinstance(column, ColumnHandle):
+        if column.stats is None:
+            column.stats = _stats_from_array(column.arr)
+        return column.stats.to_dict()
+    return _stats_from_array(_array_from(df, column)).to_dict()
+
+
+def _get_fig(
+    figsize: tuple[float, float],
+    style: Optional[str] = None,
+    interactive: bool = False,
+) -> tuple[Figure, Axes]:
+    """
+    Return a (Figure, Axes) pair for the given figsize with a cleared Axes.
+
+    Non-interactive figures are built with the object API on an Agg canvas and cached per
+    figsize and style (which must already be applied to rcParams by the caller);
+    interactive ones go through pyplot so that plt.show() can display them.
+    pyplot (and with it the GUI backend) is only imported on that interactive path.
+    """
+    if interactive:
+        import matplotlib.pyplot as plt
+
+        return plt.subplots(figsize=figsize)
+    key = (figsize, style)
+    cached = _FIG_CACHE.get(key)
+    if cached is None:
+        fig = Figure(figsize=figsize, dpi=SAVE_DPI)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        _FIG_CACHE[key] = (fig, ax)
+        return fig, ax
+    fig, ax = cached
+    ax.clear()
+    return fig, ax
+
+
+def _save_fig(fig: Figure, out: Path) -> None:
+    if out.suffix.lower() == ".png" and isinstance(fig.canvas, FigureCanvasAgg) and fig.dpi == SAVE_DPI:
+        # Render straight to PNG on the Agg canvas, bypassing savefig's format dispatch
+        fig.canvas.print_png(out, metadata={})
+    else:
+        fig.savefig(out, dpi=SAVE_DPI, bbox_inches=None, pad_inches=0, metadata={})
+
+
+def _time_axis(df: pd.DataFrame) -> Optional[pd.Series]:
+    # Choose an index for x-axis if DataFrame has a datetime-like column named 'date' or 'time'
+    date_cols = [c for c in ("date", "time", "timestamp", "Date", "Time", "Timestamp") if c in df.columns]
+    for candidate in date_cols:
+        col = df[candidate]
+        if pd.api.types.is_datetime64_any_dtype(col):
+            return col
+        # Only text (or categorical) columns are worth a full to_datetime parse
+        if not (
+            pd.api.types.is_object_dtype(col)
+            or pd.api.types.is_string_dtype(col)
+            or isinstance(col.dtype, pd.CategoricalDtype)
+        ):
+            continue
+        try:
+            x_candidate = pd.to_datetime(col, errors="coerce", cache=True)
+            if x_candidate.notna().any():
+                return x_candidate
+        except Exception:
+            pass
+    return None
+
+
+def _draw_series(
+    ax: Axes,
+    s: pd.Series,
+    x: Optional[pd.Series],
+    label: str,
+    title: Optional[str],
+    ma_window: Optional[int],
+    downsample: Optional[int],
+    markers: Optional[bool] = None,
+) -> None:
+    values = _array_from(None, s)
+    ma_values = None
+    if ma_window is not None and isinstance(ma_window, int) and ma_window >= 2:
+        if _HAS_BN and len(values) > 0:
+            # bottleneck rejects windows longer than the data; with min_count=1 the clamped
+            # window gives the same expanding mean as pandas' rolling(min_periods=1)
+            ma_values = bn.move_mean(values, window=min(ma_window, len(values)), min_count=1)
+        else:
+            ma_values = s.rolling(window=ma_window, min_periods=1, center=False).mean().to_numpy()
+
+    xs = x if x is not None else np.arange(len(values))
+    if downsample is not None and len(values) > downsample:
+        if x is not None:
+            t = (x - x.min()).dt.total_seconds().to_numpy(dtype=np.float64)
+        else:
+            t = np.arange(len(values), dtype=np.float64)
+        valid = np.flatnonzero(~(np.isnan(values) | np.isnan(t)))
+        idx = valid[_lttb(t[valid], values[valid], downsample)]
+        xs = x.iloc[idx] if x is not None else idx
+        values = values[idx]
+        if ma_values is not None:
+            ma_values = ma_values[idx]
+
+    if markers is None:
+        markers = len(values) <= MARKER_MAX_POINTS
+    ax.plot(xs, values, marker="o" if markers else None, linestyle="-", label=label)
+    ax.set_xlabel("Time" if x is not None else "Index")
+    ax.set_ylabel(label)
+    ax.grid(True, linestyle=":", alpha=0.6)
+    ax.set_title(title or f"Series: {label}")
+
+    # Overlay moving average if requested
+    if ma_values is not None:
+        ax.plot(xs, ma_values, color="C3", linewidth=2.0, label=f"MA({ma_window})")
+
+    ax.legend(loc="best")
 
 
 def plot_series(
@@ -78,6 +395,8 @@ def plot_series(
     show: bool = False,
     ma_window: Optional[int] = None,
     style: Optional[str] = "ggplot",
+    downsample: Optional[int] = 2000,
+    markers: Optional[bool] = None,
 ) -> Path:
     """
     Plot a line chart of the selected column and save it as an image.
@@ -89,66 +408,90 @@ def plot_series(
     :param show: If True, also display the plot window (interactive) in addition to saving it.
     :param ma_window: If set (>=2), overlay a moving average with the given window size.
     :param style: Matplotlib style name to use (e.g., 'ggplot'); set None to use default.
+    :param downsample: If the series is longer than this, plot only this many points chosen
+        by LTTB downsampling (NaN points are dropped); set None to plot every point.
+    :param markers: Draw a marker at every point; by default only when at most
+        MARKER_MAX_POINTS points are plotted.
     :return: Path to the saved image file.
     """
     s = _series_from(df, column)
-
-    # Choose an index for x-axis if DataFrame has a datetime-like column named 'date' or 'time'
-    x = None
-    for candidate in ("date", "time", "timestamp", "Date", "Time", "Timestamp"):
-        if candidate in df.columns:
-            try:
-                x_candidate = pd.to_datetime(df[candidate], errors="coerce")
-                if x_candidate.notna().any():
-                    x = x_candidate
-                    break
-            except Exception:
-                pass
+    x = _time_axis(df)
 
     if style:
         try:
-            plt.style.use(style)
+            mpl_style.use(style)
         except Exception:
             pass
 
-    fig, ax = plt.subplots(figsize=(8, 4.5))
-    if x is not None:
-        ax.plot(x, s.values, marker="o", linestyle="-", label=str(column))
-        ax.set_xlabel("Time")
-    else:
-        ax.plot(s.values, marker="o", linestyle="-", label=str(column))
-        ax.set_xlabel("Index")
-    ax.set_ylabel(str(column))
-    ax.grid(True, linestyle=":", alpha=0.6)
-    ax.set_title(title or f"Series: {column}")
-
-    # Overlay moving average if requested
-    if ma_window is not None and isinstance(ma_window, int) and ma_window >= 2:
-        ma = s.rolling(window=ma_window, min_periods=1, center=False).mean()
-        if x is not None:
-            ax.plot(x, ma.values, color="C3", linewidth=2.0, label=f"MA({ma_window})")
-        else:
-            ax.plot(ma.values, color="C3", linewidth=2.0, label=f"MA({ma_window})")
-
-    ax.legend(loc="best")
+    fig, ax = _get_fig((8, 4.5), style, interactive=show)
+    _draw_series(ax, s, x, str(column), title, ma_window, downsample, markers)
     fig.tight_layout()
 
     out = Path(output_path) if output_path is not None else Path("plot.png")
     out.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(out)
+    _save_fig(fig, out)
     if show:
+        import matplotlib.pyplot as plt
+
         try:
             plt.show()
         except Exception:
             pass
-    plt.close(fig)
+        plt.close(fig)
     return out
 
 
+def plot_series_batch(
+    df: pd.DataFrame,
+    columns: list[Union[str, int]],
+    output_dir: Union[str, Path],
+    ma_window: Optional[int] = None,
+    style: Optional[str] = "ggplot",
+    downsample: Optional[int] = 2000,
+    markers: Optional[bool] = None,
+) -> list[Path]:
+    """
+    Plot a line chart for each of several columns, saving '<column>.png' files into output_dir.
+
+    One figure is reused for all columns and the time axis is detected once, so the per-plot
+    setup cost (figure/canvas construction, date parsing) is paid only for the first plot.
+
+    :param df: DataFrame with data.
+    :param columns: Columns to plot (names or indices).
+    :param output_dir: Directory to save the images into; created if missing.
+    :param ma_window: If set (>=2), overlay a moving average with the given window size.
+    :param style: Matplotlib style name to use (e.g., 'ggplot'); set None to use default.
+    :param downsample: Maximum number of points per plot (LTTB); set None to plot every point.
+    :param markers: Draw a marker at every point; by default only for short series.
+    :return: Paths to the saved image files, in the order of columns.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    x = _time_axis(df)
+
+    if style:
+        try:
+            mpl_style.use(style)
+        except Exception:
+            pass
+
+    fig, ax = _get_fig((8, 4.5), style)
+    saved = []
+    for i, column in enumerate(columns):
+        if i > 0:
+            ax.clear()
+        _draw_series(ax, _series_from(df, column), x, str(column), None, ma_window, downsample, markers)
+        # Tick labels and the y-label differ per column, so the layout is recomputed each time
+        fig.tight_layout()
+        out = output_dir / f"{column}.png"
+        _save_fig(fig, out)
+        saved.append(out)
+    return saved
+
 
 def plot_histogram(
-    df: pd.DataFrame,
-    column: Union[str, int, pd.Series],
+    df: Optional[pd.DataFrame],
+    column: Union[str, int, pd.Series, ColumnHandle],
     bins: int = 20,
     output_path: Optional[Union[str, Path]] = None,
     title: Optional[str] = None,
@@ -159,7 +502,8 @@ def plot_histogram(
     Plot a histogram of the selected column and save it as an image.
 
     :param df: DataFrame with data.
-    :param column: Column to plot (name, index, or Series).
+    :param column: Column to plot (name, index, Series, or a ColumnHandle from prepare_column,
+        in which case df is not used).
     :param bins: Number of histogram bins.
     :param output_path: File path to save the plot (e.g., 'hist.png'). If None, saves to 'hist.png' in CWD.
     :param title: Optional plot title.
@@ -167,29 +511,39 @@ def plot_histogram(
     :param style: Matplotlib style name to use; set None to use default.
     :return: Path to the saved image file.
     """
-    s = _series_from(df, column).dropna()
+    if isinstance(column, ColumnHandle):
+        label = column.name
+        arr = column.arr
+        value_range = (column.stats.min, column.stats.max) if column.stats is not None else None
+    else:
+        label = str(column)
+        arr = _array_from(df, column)
+        value_range = None
+    counts, edges = _histogram(arr, bins, value_range)
 
     if style:
         try:
-            plt.style.use(style)
+            mpl_style.use(style)
         except Exception:
             pass
 
-    fig, ax = plt.subplots(figsize=(7, 4.5))
-    ax.hist(s.values, bins=bins, color="C0", alpha=0.8, edgecolor="black")
-    ax.set_xlabel(str(column))
+    fig, ax = _get_fig((7, 4.5), style, interactive=show)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge", color="C0", alpha=0.8, edgecolor="black")
+    ax.set_xlabel(label)
     ax.set_ylabel("Count")
     ax.grid(True, linestyle=":", alpha=0.4)
-    ax.set_title(title or f"Histogram: {column}")
+    ax.set_title(title or f"Histogram: {label}")
     fig.tight_layout()
 
     out = Path(output_path) if output_path is not None else Path("hist.png")
     out.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(out)
+    _save_fig(fig, out)
     if show:
+        import matplotlib.pyplot as plt
+
         try:
             plt.show()
         except Exception:
             pass
-    plt.close(fig)
+        plt.close(fig)
     return out
@@ -1,9 +1,19 @@
 import math
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pytest
 
-from src.analyzer import load_data, compute_stats, plot_series
+from src.analyzer import (
+    load_data,
+    load_data_iter,
+    compute_stats,
+    plot_series,
+    plot_series_batch,
+    plot_histogram,
+    prepare_column,
+)
 
 
 def test_compute_stats_basic(tmp_path):
@@ -27,6 +37,125 @@ def test_compute_stats_basic(tmp_path):
     assert math.isclose(stats["std"], 2.0, rel_tol=1e-9)
 
 
+def test_load_data_parse_dates_arrow(tmp_path):
+    pytest.importorskip("pyarrow")
+    from src.analyzer import _read_csv_arrow
+
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("""date,site,temperature
+2025-01-01 12:00:00,,10
+2025-01-02T06:30:00,north,12
+2025-01-03,south,14
+""")
+
+    # Parsed by arrow itself, including the ISO-8601 variants
+    df = _read_csv_arrow(csv_path, parse_dates="date")
+    assert df is not None
+    assert pd.api.types.is_datetime64_any_dtype(df["date"])
+    assert df["date"].tolist() == [
+        pd.Timestamp("2025-01-01 12:00"),
+        pd.Timestamp("2025-01-02 06:30"),
+        pd.Timestamp("2025-01-03"),
+    ]
+    assert pd.isna(df["site"][0])
+
+    df = load_data(csv_path, parse_dates="date", categorize=False)
+    assert pd.api.types.is_datetime64_any_dtype(df["date"])
+    assert pd.isna(df["site"][0])
+
+    # Formats arrow rejects fall back to pandas
+    csv_path.write_text("""date,temperature
+01/02/2025,10
+01/03/2025,12
+""")
+    assert _read_csv_arrow(csv_path, parse_dates="date") is None
+    df = load_data(csv_path, parse_dates="date")
+    assert df["date"].tolist() == [pd.Timestamp("2025-01-02"), pd.Timestamp("2025-01-03")]
+
+
+def test_load_data_arrow_matches_pandas_semantics(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("""date,time,value,value
+2025-01-01,12:00:00,1,2
+2025-01-02,13:30:00,3,4
+""")
+
+    # Duplicate headers are renamed as pandas does
+    df = load_data(csv_path, categorize=False)
+    assert list(df.columns) == ["date", "time", "value", "value.1"]
+
+    # Date-like columns that were not requested stay text on every path
+    chunked = load_data(csv_path, chunksize=1, categorize=False)
+    for frame in (df, chunked):
+        assert pd.api.types.is_string_dtype(frame["date"])
+        assert pd.api.types.is_string_dtype(frame["time"])
+    assert df["date"].tolist() == chunked["date"].tolist() == ["2025-01-01", "2025-01-02"]
+
+    # Requested columns that do not exist are an error, not silently ignored
+    with pytest.raises(KeyError):
+        load_data(csv_path, parse_dates="missing")
+    with pytest.raises(KeyError):
+        load_data(csv_path, parse_dates="missing", chunksize=1)
+
+
+def test_read_csv_arrow_defers_duplicate_headers(tmp_path):
+    pytest.importorskip("pyarrow")
+    from src.analyzer import _read_csv_arrow
+
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("a,a\n1,2\n")
+    assert _read_csv_arrow(csv_path) is None
+
+
+def test_load_data_chunked(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("""date,temperature
+2025-01-01,10
+2025-01-02,12
+2025-01-03,14
+""")
+
+    chunks = list(load_data_iter(csv_path, chunksize=2))
+    assert [len(c) for c in chunks] == [2, 1]
+
+    df = load_data(csv_path, parse_dates="date", chunksize=2)
+    assert len(df) == 3
+    assert list(df.index) == [0, 1, 2]
+    assert pd.api.types.is_datetime64_any_dtype(df["date"])
+    assert df["temperature"].tolist() == [10, 12, 14]
+
+
+def test_load_data_keeps_float64_by_default(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("""value
+10.1
+12.3
+14.7
+1700000000123
+""")
+
+    df = load_data(csv_path)
+    assert df["value"].dtype == np.float64
+    stats = compute_stats(df, "value")
+    assert stats["min"] == 10.1
+    assert stats["max"] == 1700000000123.0
+
+
+def test_load_data_downcasts_floats(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("""value
+0.5
+1.5
+2.5
+""")
+
+    assert load_data(csv_path, downcast=True)["value"].dtype == np.float32
+
+    stats = compute_stats(load_data(csv_path, downcast=True), "value")
+    assert math.isclose(stats["mean"], 1.5, rel_tol=1e-6)
+    assert math.isclose(stats["std"], 1.0, rel_tol=1e-6)
+
+
 def test_plot_series_creates_file(tmp_path):
     df = pd.DataFrame({
         "date": pd.to_datetime(["2025-01-01", "2025-01-02", "2025-01-03"]),
@@ -38,6 +167,82 @@ def test_plot_series_creates_file(tmp_path):
     assert out_path.exists() and out_path.stat().st_size > 0
 
 
+def test_plots_saved_at_80_dpi_via_print_png(tmp_path, monkeypatch):
+    from matplotlib import image as mpimg
+    from matplotlib.figure import Figure
+
+    # PNGs from the cached Agg figures must not go through savefig's format dispatch
+    def fail_savefig(self, *args, **kwargs):
+        raise AssertionError("savefig should not be used for PNG output")
+
+    monkeypatch.setattr(Figure, "savefig", fail_savefig)
+    df = pd.DataFrame({"temperature": [10, 12, 14]})
+
+    series_png = plot_series(df, "temperature", tmp_path / "plot.png")
+    hist_png = plot_histogram(df, "temperature", output_path=tmp_path / "hist.png")
+    assert mpimg.imread(series_png).shape[:2] == (360, 640)
+    assert mpimg.imread(hist_png).shape[:2] == (360, 560)
+
+
+def test_plot_series_markers_threshold(tmp_path, monkeypatch):
+    import src.analyzer as analyzer
+
+    monkeypatch.setattr(analyzer, "_FIG_CACHE", {})
+    short = pd.DataFrame({"value": np.arange(10.0)})
+    long = pd.DataFrame({"value": np.arange(analyzer.MARKER_MAX_POINTS + 1.0)})
+
+    def marker_of(df, **kwargs):
+        plot_series(df, "value", tmp_path / "plot.png", downsample=None, **kwargs)
+        (_, ax), = analyzer._FIG_CACHE.values()
+        return ax.lines[0].get_marker()
+
+    assert marker_of(short) == "o"
+    assert marker_of(long) == "None"
+    assert marker_of(long, markers=True) == "o"
+    assert marker_of(short, markers=False) == "None"
+
+
+def test_plot_series_batch_creates_files(tmp_path):
+    df = pd.DataFrame({
+        "date": pd.to_datetime(["2025-01-01", "2025-01-02", "2025-01-03"]),
+        "temperature": [10, 12, 14],
+        "pressure": [1000.5, 1001.0, 999.8],
+    })
+    saved = plot_series_batch(df, ["temperature", "pressure"], tmp_path / "plots", ma_window=2)
+    assert saved == [tmp_path / "plots" / "temperature.png", tmp_path / "plots" / "pressure.png"]
+    assert all(p.exists() and p.stat().st_size > 0 for p in saved)
+
+
+def test_column_handle_shared_by_stats_and_histogram(tmp_path):
+    df = pd.DataFrame({"temperature": [10, None, "bad", 12, 14]})
+    handle = prepare_column(df, "temperature")
+    assert handle.arr.tolist() == [10.0, 12.0, 14.0]
+
+    stats = compute_stats(None, handle)
+    assert stats == compute_stats(df, "temperature")
+    assert handle.stats is not None and handle.stats.max == 14
+
+    out_path = tmp_path / "hist.png"
+    assert plot_histogram(None, handle, bins=4, output_path=out_path) == out_path
+    assert out_path.stat().st_size > 0
+
+
+def test_plot_series_batch_relayouts_each_column(tmp_path, monkeypatch):
+    import src.analyzer as analyzer
+
+    monkeypatch.setattr(analyzer, "_FIG_CACHE", {})
+    df = pd.DataFrame({
+        "a": [0.0, 1.0, 2.0],
+        "long_name_b": [-15000.0, -12000.0, -16000.0],
+    })
+    plot_series_batch(df, ["a", "long_name_b"], tmp_path)
+
+    # The last column's tick labels and y-label must still fit inside the figure
+    (fig, ax), = analyzer._FIG_CACHE.values()
+    bbox = ax.get_tightbbox(fig.canvas.get_renderer())
+    assert bbox.x0 >= 0
+
+
 def test_load_data_file_not_found(tmp_path):
     missing = tmp_path / "missing.csv"
     try:
@@ -45,3 +250,154 @@ def test_load_data_file_not_found(tmp_path):
         assert False, "Expected FileNotFoundError"
     except FileNotFoundError:
         pass
+
+
+def test_plot_series_reuses_figure(tmp_path, monkeypatch):
+    import src.analyzer as analyzer
+
+    monkeypatch.setattr(analyzer, "_FIG_CACHE", {})
+    df = pd.DataFrame({
+        "date": pd.to_datetime(["2025-01-01", "2025-01-02", "2025-01-03"]),
+        "temperature": [10, 12, 14],
+        "humidity": [0.5, 0.6, 0.55],
+    })
+    first = plot_series(df, "temperature", tmp_path / "t.png", ma_window=2)
+    assert len(analyzer._FIG_CACHE) == 1
+    (cached_fig, cached_ax), = analyzer._FIG_CACHE.values()
+
+    second = plot_series(df, "humidity", tmp_path / "h.png")
+    assert first.stat().st_size > 0 and second.stat().st_size > 0
+    assert len(analyzer._FIG_CACHE) == 1
+    # The second plot cleared the first one's artists before drawing its own
+    assert [line.get_label() for line in cached_ax.lines] == ["humidity"]
+    assert analyzer._get_fig((8, 4.5), "ggplot") == (cached_fig, cached_ax)
+
+
+def test_plot_series_ma_window_longer_than_series(tmp_path, monkeypatch):
+    import src.analyzer as analyzer
+
+    monkeypatch.setattr(analyzer, "_FIG_CACHE", {})
+    df = pd.DataFrame({"value": [1.0, 2.0, 6.0]})
+    out_path = plot_series(df, "value", tmp_path / "ma.png", ma_window=5)
+    assert out_path.stat().st_size > 0
+
+    (_, ax), = analyzer._FIG_CACHE.values()
+    ma_line = ax.lines[1]
+    assert ma_line.get_label() == "MA(5)"
+    assert np.allclose(ma_line.get_ydata(), [1.0, 1.5, 3.0])
+
+    empty = pd.DataFrame({"value": pd.Series([], dtype=float)})
+    assert plot_series(empty, "value", tmp_path / "empty.png", ma_window=5).exists()
+
+
+def test_lttb_keeps_endpoints_and_peak():
+    from src._kernels import _lttb, _lttb_numpy
+
+    y = np.zeros(1000)
+    y[437] = 5.0
+    t = np.arange(1000, dtype=np.float64)
+    for lttb in (_lttb, _lttb_numpy):
+        idx = lttb(t, y, 50)
+        assert len(idx) == 50
+        assert idx[0] == 0 and idx[-1] == 999
+        assert 437 in idx
+        assert np.all(np.diff(idx) > 0)
+
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=5000)
+    t = np.arange(5000, dtype=np.float64)
+    assert np.array_equal(_lttb(t, y, 300), _lttb_numpy(t, y, 300))
+
+
+def test_welford_minmax_matches_numpy():
+    from src._kernels import _welford_minmax, _welford_minmax_numpy
+
+    rng = np.random.default_rng(0)
+    arr = rng.normal(loc=5.0, scale=3.0, size=10_001)
+    arr[::7] = np.nan
+    for got, expected in zip(_welford_minmax(arr), _welford_minmax_numpy(arr)):
+        assert math.isclose(got, expected, rel_tol=1e-9)
+
+
+def test_compute_stats_skips_nan_and_non_numeric():
+    df = pd.DataFrame({"value": ["10", None, "abc", 14.0, np.nan], "label": ["a", "b", "c", "d", "e"]})
+    stats = compute_stats(df, "value")
+    assert stats["min"] == 10 and stats["max"] == 14
+    assert math.isclose(stats["mean"], 12.0, rel_tol=1e-9)
+    assert math.isclose(stats["std"], math.sqrt(8.0), rel_tol=1e-9)
+
+    try:
+        compute_stats(df, "label")
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_load_data_categorizes_repeated_strings(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("""date,site,temperature
+2025-01-01,north,10
+2025-01-01,south,11
+2025-01-01,north,12
+2025-01-02,south,13
+2025-01-02,north,14
+""")
+
+    df = load_data(csv_path)
+    assert isinstance(df["site"].dtype, pd.CategoricalDtype)
+    assert not isinstance(load_data(csv_path, categorize=False)["site"].dtype, pd.CategoricalDtype)
+
+    out_path = tmp_path / "plot.png"
+    assert plot_series(df, "temperature", out_path) == out_path
+
+
+def test_histogram_rejects_non_positive_bins(tmp_path):
+    from src._kernels import _histogram
+
+    for bins in (0, -1):
+        with pytest.raises(ValueError, match="must be positive"):
+            _histogram(np.array([1.0, 2.0, 3.0]), bins)
+        with pytest.raises(ValueError, match="must be positive"):
+            plot_histogram(pd.DataFrame({"v": [1.0, 1.0]}), "v", bins=bins, output_path=tmp_path / "h.png")
+
+
+def test_histogram_matches_numpy():
+    from src._kernels import _histogram
+
+    rng = np.random.default_rng(0)
+    arr = rng.normal(size=10_000)
+    arr[::13] = np.nan
+    counts, edges = _histogram(arr, 25)
+    expected_counts, expected_edges = np.histogram(arr[~np.isnan(arr)], bins=25)
+    assert np.array_equal(counts, expected_counts)
+    assert np.allclose(edges, expected_edges)
+
+    # Quantized data puts many values exactly on bin edges
+    for dtype in (np.float64, np.float32):
+        for n_bins in (7, 13, 20, 33, 48):
+            arr = (rng.integers(0, 50, 500) * 0.1).astype(dtype)
+            counts, edges = _histogram(arr, n_bins)
+            expected_counts, expected_edges = np.histogram(arr, bins=n_bins)
+            assert np.array_equal(counts, expected_counts)
+            assert np.array_equal(edges, expected_edges)
+
+
+def test_plot_series_applies_style_with_cached_figure(tmp_path, monkeypatch):
+    import matplotlib as mpl
+    from matplotlib import image as mpimg
+
+    import src.analyzer as analyzer
+
+    monkeypatch.setattr(analyzer, "_FIG_CACHE", {})
+    df = pd.DataFrame({"temperature": [10, 12, 14]})
+    with mpl.rc_context():
+        mpl.rcdefaults()
+        plot_series(df, "temperature", tmp_path / "plain.png", style=None)
+        plot_series(df, "temperature", tmp_path / "ggplot.png", style="ggplot")
+
+    # Sample the axes background between the title and the plotted line
+    plain = mpimg.imread(tmp_path / "plain.png")
+    styled = mpimg.imread(tmp_path / "ggplot.png")
+    h, w = styled.shape[:2]
+    assert np.allclose(plain[h // 4, w // 2, :3], 1.0)
+    assert np.allclose(styled[h // 4, w // 2, :3], 0xE5 / 255, atol=0.01)